@@ -0,0 +1,45 @@
+"""Console helpers and constants shared by the CommitLM subcommands."""
+
+import contextlib
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Tuple
+
+import click
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+PROVIDERS: Tuple[str, ...] = ("huggingface", "gemini", "anthropic", "openai")
+PROVIDER_CHOICE = click.Choice(PROVIDERS)
+
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """Create the shared console on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+@lru_cache(maxsize=1)
+def get_err_console() -> "Console":
+    """Create the shared stderr console on first use."""
+    from rich.console import Console
+
+    return Console(file=sys.stderr)
+
+
+class _NoStatus:
+    """Stand-in for rich's Status when there is no terminal to animate."""
+
+    def update(self, *args, **kwargs) -> None:
+        pass
+
+
+def status_spinner(message: str, **kwargs):
+    """Show a spinner while work runs, but only when stdout is a terminal."""
+    console = get_console()
+    if console.is_terminal:
+        return console.status(message, **kwargs)
+    return contextlib.nullcontext(_NoStatus())
@@ -0,0 +1,77 @@
+"""Git alias setup command for CommitLM."""
+
+import sys
+
+import click
+
+from ._shared import get_console
+
+
+@click.command()
+@click.pass_context
+def set_alias(ctx: click.Context):
+    """Set a git alias for easy commit message generation."""
+    from InquirerPy import prompt
+
+    console = get_console()
+    console.print("[bold blue]Setting up git alias[/bold blue]")
+
+    import subprocess
+
+    try:
+        subprocess.run(["git", "--version"], capture_output=True, check=True)
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        console.print("[red]❌ Git is not installed or not in your PATH.[/red]")
+        sys.exit(1)
+
+    def is_alias_taken(name):
+        # 'git config --get' exits non-zero when the key is not set at any level
+        result = subprocess.run(
+            ["git", "config", "--get", f"alias.{name}"], capture_output=True
+        )
+        return result.returncode == 0
+
+    questions = [
+        {
+            "type": "input",
+            "message": "Enter a name for the git alias",
+            "name": "alias_name",
+            "default": "c",
+            "qmark": "",
+        }
+    ]
+    answers = prompt(questions)
+    alias_name = answers.get("alias_name")
+
+    if is_alias_taken(alias_name):
+        questions = [
+            {
+                "type": "list",
+                "message": f"Alias '{alias_name}' is already taken. Overwrite?",
+                "choices": ["Yes", "No"],
+                "name": "overwrite",
+                "default": "No",
+                "qmark": "",
+            }
+        ]
+        answers = prompt(questions)
+        if answers.get("overwrite") == "No":
+            console.print("[yellow]Alias setup cancelled.[/yellow]")
+            return
+
+    alias_command = "!git diff --cached | commitlm-msg | git commit -F -"
+    try:
+        subprocess.run(
+            ["git", "config", "--global", f"alias.{alias_name}", alias_command],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except subprocess.CalledProcessError as e:
+        console.print(f"[red]❌ Failed to set alias: {e.stderr.strip()}[/red]")
+        sys.exit(1)
+
+    console.print(f"[green]✅ Alias '{alias_name}' set successfully.[/green]")
+    console.print(
+        f"You can now use 'git {alias_name}' to commit with a generated message."
+    )
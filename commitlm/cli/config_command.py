@@ -0,0 +1,190 @@
+"""Configuration management commands for CommitLM."""
+
+from operator import attrgetter
+from pathlib import Path
+from typing import Optional, Union
+
+import click
+
+from ._shared import get_console, PROVIDERS
+
+_TRUTHY = frozenset({"true", "1", "yes", "on", "y"})
+_FALSY = frozenset({"false", "0", "no", "off", "n"})
+
+
+@click.group()
+def config():
+    """Manage configuration settings."""
+    pass
+
+
+@config.command("get")
+@click.argument("key", required=False)
+@click.pass_context
+def config_get(ctx: click.Context, key: Optional[str]):
+    """Get a configuration value."""
+    console = get_console()
+    settings = ctx.obj["settings"]
+    if key:
+        try:
+            value = attrgetter(key)(settings)
+        except AttributeError:
+            # A segment is missing or goes through a plain dict; walk it step by step
+            value = settings
+            for k in key.split("."):
+                if isinstance(value, dict):
+                    value = value.get(k)
+                else:
+                    value = getattr(value, k, None)
+                if value is None:
+                    break
+        if value is None:
+            console.print(f"[red]Configuration key '{key}' not found.[/red]")
+            return
+        console.print(value)
+    else:
+        console.print(settings.model_dump_json(indent=2))
+
+
+@config.command("set")
+@click.argument("key")
+@click.argument("value")
+@click.pass_context
+def config_set(ctx: click.Context, key: str, value: str):
+    """Set a configuration value."""
+    console = get_console()
+    settings = ctx.obj["settings"]
+    keys = key.split(".")
+    parent_key, _, attr_name = key.rpartition(".")
+    try:
+        s = attrgetter(parent_key)(settings) if parent_key else settings
+    except AttributeError:
+        console.print(f"[red]Configuration key '{key}' not found.[/red]")
+        return
+
+    # Try to convert value to the correct type
+    converted_value: Union[str, bool, int, float] = value
+    current_value = getattr(s, attr_name, None)
+    if isinstance(current_value, bool):
+        lowered = value.lower()
+        if lowered in _TRUTHY:
+            converted_value = True
+        elif lowered in _FALSY:
+            converted_value = False
+        else:
+            console.print(
+                f"[red]Invalid boolean value '{value}' for '{key}' "
+                "(use true/false, yes/no, on/off or 1/0).[/red]"
+            )
+            return
+    else:
+        try:
+            if isinstance(current_value, int):
+                converted_value = int(value)
+            elif isinstance(current_value, float):
+                converted_value = float(value)
+        except ValueError:
+            pass  # Keep as string if conversion fails
+
+    setattr(s, attr_name, converted_value)
+
+    config_path = ctx.obj["config_path"]
+    if config_path is None:
+        console.print("[red]No configuration file found (run 'commitlm init').[/red]")
+        return
+
+    # Patch just this key in the file on disk instead of dumping every field
+    # (including defaults) of the settings model back out.
+    from ..config.settings import dump_config_bytes, load_config_bytes
+
+    config_path = Path(config_path)
+    try:
+        config_data = load_config_bytes(config_path.read_bytes())
+    except FileNotFoundError:
+        config_data = settings.model_dump()
+
+    node = config_data
+    for k in keys[:-1]:
+        if not isinstance(node.get(k), dict):
+            node[k] = {}
+        node = node[k]
+    node[keys[-1]] = converted_value
+
+    config_path.write_bytes(dump_config_bytes(config_data))
+    console.print(f"[green]Set '{key}' to '{converted_value}'[/green]")
+
+
+@config.command("change-model")
+@click.argument(
+    "task", type=click.Choice(["commit_message", "doc_generation", "default"])
+)
+@click.pass_context
+def change_model(ctx: click.Context, task: str):
+    """Change the model for a specific task."""
+    from InquirerPy import prompt
+
+    from ..config.settings import TaskSettings
+
+    console = get_console()
+    settings = ctx.obj["settings"]
+
+    if task == "default":
+        questions = [
+            {
+                "type": "list",
+                "message": "Select LLM provider",
+                "choices": list(PROVIDERS),
+                "name": "provider",
+                "default": settings.provider,
+                "qmark": "",
+            },
+            {
+                "type": "input",
+                "message": "Enter the model name",
+                "name": "model",
+                "default": settings.model,
+                "qmark": "",
+            },
+        ]
+        answers = prompt(questions)
+        provider = answers.get("provider")
+        model = answers.get("model")
+        settings.provider = provider
+        settings.model = model
+    else:
+        task_settings = getattr(settings, task, None)
+        if not task_settings:
+            task_settings = TaskSettings()
+            setattr(settings, task, task_settings)
+
+        default_provider = (
+            task_settings.provider if task_settings.provider else settings.provider
+        )
+        default_model = task_settings.model if task_settings.model else settings.model
+
+        questions = [
+            {
+                "type": "list",
+                "message": f"Select LLM provider for {task}",
+                "choices": list(PROVIDERS),
+                "name": "provider",
+                "default": default_provider,
+                "qmark": "",
+            },
+            {
+                "type": "input",
+                "message": f"Enter the model name for {task}",
+                "name": "model",
+                "default": default_model,
+                "qmark": "",
+            },
+        ]
+        answers = prompt(questions)
+        provider = answers.get("provider")
+        model = answers.get("model")
+
+        task_settings.provider = provider
+        task_settings.model = model
+
+    settings.save_to_file(ctx.obj["config_path"])
+    console.print(f"[green]✅ Model for '{task}' updated successfully.[/green]")
@@ -0,0 +1,45 @@
+"""Lightweight commit message entry point used by the git hook and alias."""
+
+import sys
+
+
+def main() -> None:
+    """Read a diff from stdin and print a short commit message (commitlm-msg).
+
+    This does the same job as ``commitlm generate --short-message`` but skips
+    Click, rich and the CLI context, since it runs on every commit.
+    """
+    diff_content = sys.stdin.buffer.read().decode("utf-8", errors="replace")
+    if not diff_content.strip():
+        print("CommitLM: no diff on stdin (git add ...)", file=sys.stderr)
+        sys.exit(1)
+
+    from ..config.settings import init_settings
+    from ..utils.helpers import get_git_root
+
+    git_root = get_git_root()
+    config_path = (git_root / ".commitlm-config.json") if git_root else None
+
+    try:
+        from ..core.llm_client import create_llm_client
+
+        settings = init_settings(config_path=config_path)
+
+        # Header goes to stderr so it isn't captured as part of the message
+        task_settings = settings.commit_message
+        provider = (task_settings and task_settings.provider) or settings.provider
+        model = (task_settings and task_settings.model) or settings.model
+        print("CommitLM: generate commit message", file=sys.stderr)
+        print(f"Using provider: {provider}, model: {model}", file=sys.stderr)
+
+        client = create_llm_client(settings, task="commit_message")
+        message = client.generate_short_message(diff_content)
+    except Exception as e:
+        print(f"CommitLM: failed to generate commit message: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(message)
+
+
+if __name__ == "__main__":
+    main()
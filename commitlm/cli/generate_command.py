@@ -0,0 +1,155 @@
+"""Generate command for CommitLM."""
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from ._shared import get_console, get_err_console, PROVIDER_CHOICE, status_spinner
+
+
+@click.command()
+@click.argument("diff_content", required=False)
+@click.option(
+    "--file", "file_path", type=click.Path(exists=True), help="Read diff from file"
+)
+@click.option("--output", type=click.Path(), help="Save documentation to file")
+@click.option(
+    "--provider",
+    type=PROVIDER_CHOICE,
+    help="Override LLM provider for this generation",
+)
+@click.option("--model", type=str, help="Override LLM model for this generation")
+@click.option(
+    "--short-message", is_flag=True, help="Generate a short commit message", hidden=True
+)
+@click.pass_context
+def generate(
+    ctx: click.Context,
+    diff_content: Optional[str],
+    file_path: Optional[str],
+    output: Optional[str],
+    provider: Optional[str],
+    model: Optional[str],
+    short_message: bool,
+):
+    """Generate documentation or a short commit message from git diff content."""
+    console = get_console()
+    overrides = {}
+    if provider:
+        overrides["provider"] = provider
+    if model:
+        overrides["model"] = model
+    settings = ctx.obj["settings"]
+    if overrides:
+        from ..config.settings import apply_overrides
+
+        settings = apply_overrides(settings, overrides)
+
+    # Decode once from raw bytes instead of through a text wrapper
+    if file_path:
+        diff_content = Path(file_path).read_bytes().decode("utf-8", errors="replace")
+    elif not diff_content and not sys.stdin.isatty():
+        diff_content = sys.stdin.buffer.read().decode("utf-8", errors="replace")
+
+    # If diff_content is an empty string (from stdin), treat it as no content.
+    if diff_content is not None and not diff_content.strip():
+        diff_content = None
+
+    if not diff_content:
+        import subprocess
+
+        try:
+            # One git call: an empty staged diff means there is nothing to commit
+            diff_proc = subprocess.run(
+                ["git", "diff", "--cached"], capture_output=True, text=True
+            )
+        except FileNotFoundError:
+            console.print("[red]❌ Git is not installed or not in your PATH.[/red]")
+            sys.exit(1)
+        if diff_proc.returncode == 0 and not diff_proc.stdout.strip():
+            console.print(
+                "[yellow]⚠️ No changes added to commit (git add ...)[/yellow]"
+            )
+            sys.exit(1)
+        diff_content = diff_proc.stdout
+
+    if not diff_content:
+        console.print(
+            "[red]❌ Please provide diff content via argument, file, or stdin.[/red]"
+        )
+        sys.exit(1)
+
+    try:
+        from ..core.llm_client import create_llm_client
+
+        if short_message:
+            # Get the actual provider/model that will be used for commit message generation
+            task_settings = settings.commit_message
+            if task_settings and (task_settings.provider or task_settings.model):
+                actual_provider = task_settings.provider or settings.provider
+                actual_model = task_settings.model or settings.model
+            else:
+                actual_provider = settings.provider
+                actual_model = settings.model
+
+            # Display header with model information to stderr (won't be captured by git hook)
+            _echo_err("CommitLM: generate commit message", "bold blue")
+            _echo_err(
+                f"Using provider: {actual_provider}, model: {actual_model}", "blue"
+            )
+
+            client = create_llm_client(settings, task="commit_message")
+            # When generating a short message for the hook, just print the raw text to stdout
+            message = client.generate_short_message(diff_content)
+            print(message)
+            sys.exit(0)
+        else:
+            # Get the actual provider/model that will be used for doc generation
+            task_settings = settings.doc_generation
+            if task_settings and (task_settings.provider or task_settings.model):
+                actual_provider = task_settings.provider or settings.provider
+                actual_model = task_settings.model or settings.model
+            else:
+                actual_provider = settings.provider
+                actual_model = settings.model
+
+            client = create_llm_client(settings, task="doc_generation")
+
+        console.print(
+            f"[blue]Using provider: {actual_provider}, model: {actual_model}[/blue]"
+        )
+
+        with status_spinner(
+            "[bold green]Generating documentation...", spinner="dots"
+        ) as status:
+            documentation = client.generate_documentation(diff_content)
+            status.update("[bold green]Documentation generated.[/bold green]")
+
+        if output:
+            output_path = Path(output)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_text(documentation)
+            console.print(f"[green]Documentation saved to {output_path}[/green]")
+        else:
+            from rich.panel import Panel
+
+            console.print("\n[bold]Generated Documentation:[/bold]")
+            console.print(
+                Panel(documentation, title="Documentation", border_style="green")
+            )
+
+    except Exception as e:
+        _echo_err(f"Failed to generate documentation: {e}", "red")
+        if ctx.obj["debug"]:
+            get_err_console().print_exception()
+        sys.exit(1)
+
+
+def _echo_err(message: str, style: str) -> None:
+    """Print to stderr, using rich only when stderr is a terminal."""
+    if sys.stderr.isatty():
+        get_err_console().print(f"[{style}]{message}[/{style}]")
+    else:
+        print(message, file=sys.stderr)
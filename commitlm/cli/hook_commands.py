@@ -0,0 +1,175 @@
+"""Git hook install/uninstall commands for CommitLM."""
+
+import mmap
+import os
+import sys
+from pathlib import Path
+from typing import Tuple
+
+import click
+
+from ._shared import get_console
+
+# install-hook type for each (commit_message_enabled, doc_generation_enabled) pair
+_HOOK_TYPE_FOR_TASKS = {
+    (True, True): "both",
+    (True, False): "message",
+    (False, True): "docs",
+    (False, False): "none",
+}
+
+# Hook files written for each install-hook type, in install order
+_HOOKS_FOR_TYPE = {
+    "message": ("prepare-commit-msg",),
+    "docs": ("post-commit",),
+    "both": ("prepare-commit-msg", "post-commit"),
+}
+
+
+@click.command()
+@click.argument(
+    "hook_type", type=click.Choice(["message", "docs", "both"]), default="both"
+)
+@click.option("--force", is_flag=True, help="Overwrite existing hook(s)")
+@click.pass_context
+def install_hook(ctx: click.Context, hook_type: str, force: bool):
+    """Install git hooks for automation."""
+    console = get_console()
+    console.print("[bold blue]🔗 Installing Git Hooks[/bold blue]")
+    git_root = ctx.obj["git_root"]
+
+    if not git_root:
+        console.print("[red]Not in a git repository![/red]")
+        sys.exit(1)
+
+    console.print(f"[blue]📁 Git repository detected at: {git_root}[/blue]")
+
+    _install_hooks(_HOOKS_FOR_TYPE[hook_type], force)
+
+
+def _install_hooks(hook_names: Tuple[str, ...], force: bool):
+    """Install the given hooks, sharing one git client between them."""
+    from ..integrations.git_client import get_git_client
+
+    console = get_console()
+    git_client = get_git_client()
+    installers = {
+        "prepare-commit-msg": (
+            git_client.create_prepare_commit_msg_hook_script,
+            git_client.install_prepare_commit_msg_hook_from_text,
+        ),
+        "post-commit": (
+            git_client.create_post_commit_hook_script,
+            git_client.install_post_commit_hook_from_text,
+        ),
+    }
+    hooks_dir = git_client.repo_path / ".git" / "hooks"
+
+    for hook_name in hook_names:
+        hook_file = hooks_dir / hook_name
+        try:
+            hook_file.stat()
+            hook_exists = True
+        except FileNotFoundError:
+            hook_exists = False
+
+        if hook_exists and not force:
+            from InquirerPy import prompt
+
+            questions = [
+                {
+                    "type": "list",
+                    "message": f"Hook already exists at {hook_file}. Overwrite?",
+                    "choices": ["Yes", "No"],
+                    "name": "overwrite",
+                    "default": "No",
+                    "qmark": "",
+                }
+            ]
+            answers = prompt(questions)
+            if answers.get("overwrite") == "No":
+                console.print("[yellow]Installation cancelled.[/yellow]")
+                continue
+
+        create_script, install_from_text = installers[hook_name]
+        if install_from_text(create_script()):
+            console.print(f"[green]✅ {hook_name} hook installed successfully![/green]")
+        else:
+            console.print(f"[red]❌ Failed to install {hook_name} hook[/red]")
+
+
+@click.command()
+@click.pass_context
+def uninstall_hook(ctx: click.Context):
+    """Uninstall git hooks."""
+    console = get_console()
+    console.print("[bold blue]🗑️ Uninstalling Git Hooks[/bold blue]")
+
+    git_root = ctx.obj["git_root"]
+    if not git_root:
+        console.print("[red]❌ Not in a git repository![/red]")
+        sys.exit(1)
+
+    console.print(f"[blue]📁 Git repository detected at: {git_root}[/blue]")
+
+    _uninstall_hook_file(
+        "post-commit",
+        "CommitLM Generator Post-Commit Hook",
+        git_root,
+        ctx.obj.get("debug", False),
+    )
+    _uninstall_hook_file(
+        "prepare-commit-msg",
+        "CommitLM-prepare-commit-msg",
+        git_root,
+        ctx.obj.get("debug", False),
+    )
+
+
+def _uninstall_hook_file(hook_name: str, signature: str, git_root: Path, debug: bool):
+    """Helper function to uninstall a single git hook."""
+    console = get_console()
+    try:
+        hook_file = git_root / ".git" / "hooks" / hook_name
+
+        try:
+            with open(hook_file, "rb") as f:
+                # mmap refuses empty files, and an empty hook can't be ours anyway
+                if os.fstat(f.fileno()).st_size == 0:
+                    is_commitlm_hook = False
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        is_commitlm_hook = mm.find(signature.encode()) != -1
+        except FileNotFoundError:
+            console.print(f"[yellow]⚠️  No {hook_name} hook found[/yellow]")
+            return
+
+        if not is_commitlm_hook:
+            console.print(
+                f"[yellow]⚠️  Existing {hook_name} hook doesn't appear to be from CommitLM[/yellow]"
+            )
+            from InquirerPy import prompt
+
+            questions = [
+                {
+                    "type": "list",
+                    "message": "Remove it anyway?",
+                    "choices": ["Yes", "No"],
+                    "name": "remove",
+                    "default": "No",
+                    "qmark": "",
+                }
+            ]
+            answers = prompt(questions)
+            if answers.get("remove") == "No":
+                console.print(f"[yellow]Uninstall of {hook_name} cancelled.[/yellow]")
+                return
+
+        hook_file.unlink()
+        console.print(f"[green]✅ {hook_name} hook removed successfully![/green]")
+
+    except Exception as e:
+        console.print(f"[red]❌ Failed to uninstall {hook_name} hook: {e}[/red]")
+        if debug:
+            console.print_exception()
+        sys.exit(1)
@@ -1,19 +1,49 @@
 """Initialization command for CommitLM."""
 
 import sys
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
-from rich.console import Console
-from rich.table import Table
-from InquirerPy import prompt
 
-from ..config.settings import CPU_MODEL_CONFIGS
-from ..core.llm_client import get_available_models
-
-console = Console()
+from ._shared import get_console, PROVIDER_CHOICE, PROVIDERS
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+# Suggested model for each API provider when none is given on the command line
+_DEFAULT_API_MODELS = {
+    "gemini": "gemini-2.5-flash",
+    "anthropic": "claude-3-5-haiku-latest",
+    "openai": "gpt-5-mini-2025-08-07",
+}
+
+
+@click.command()
+@click.pass_context
+@click.option(
+    "--provider",
+    type=PROVIDER_CHOICE,
+    help="LLM provider to use",
+)
+@click.option("--model", type=str, help="LLM model to use")
+@click.option(
+    "--output-dir",
+    type=click.Path(),
+    default="docs",
+    help="Output directory for documentation",
+)
+@click.option("--force", is_flag=True, help="Overwrite existing configuration")
+def init(
+    ctx: click.Context,
+    provider: Optional[str],
+    model: Optional[str],
+    output_dir: str,
+    force: bool,
+):
+    """Initialize CommitLM configuration."""
+    init_command(ctx, provider, model, output_dir, force)
 
 
 def init_command(
@@ -24,11 +54,12 @@ def init_command(
     force: bool,
 ):
     """Initialize CommitLM configuration."""
-    console.print("[bold blue]🚀 Initializing CommitLM[/bold blue]")
+    from InquirerPy import prompt
 
-    from ..utils.helpers import get_git_root
+    console = get_console()
+    console.print("[bold blue]🚀 Initializing CommitLM[/bold blue]")
 
-    git_root = get_git_root()
+    git_root = ctx.obj["git_root"]
 
     if git_root:
         config_path = git_root / ".commitlm-config.json"
@@ -40,28 +71,21 @@ def init_command(
             "[yellow]⚠️  No git repository detected. Saving config in current directory.[/yellow]"
         )
 
-    if config_path.exists() and not force:
-        questions = [
-            {
-                "type": "list",
-                "message": f"Configuration file {config_path} already exists. Overwrite?",
-                "choices": ["Yes", "No"],
-                "name": "overwrite",
-                "default": "No",
-                "qmark": "",
-            }
-        ]
-        answers = prompt(questions)
-        if answers.get("overwrite") == "No":
+    # Ask before the interview so a "No" doesn't throw away the answers;
+    # _write_config still guards against a config created in the meantime
+    overwrite = force
+    if not force and config_path.exists():
+        if not _confirm_overwrite(config_path):
             console.print("[yellow]Initialization cancelled.[/yellow]")
             return
+        overwrite = True
 
     if not provider:
         questions = [
             {
                 "type": "list",
                 "message": "Select LLM provider",
-                "choices": ["huggingface", "gemini", "anthropic", "openai"],
+                "choices": list(PROVIDERS),
                 "name": "provider",
                 "default": "huggingface",
                 "qmark": "",
@@ -155,26 +179,22 @@ def init_command(
     config_data["fallback_to_local"] = answers.get("fallback_to_local") == "Yes"
 
     try:
-        with open(config_path, "w") as f:
-            json.dump(config_data, f, indent=2)
+        if not _write_config(config_path, config_data, overwrite):
+            console.print("[yellow]Initialization cancelled.[/yellow]")
+            return
         console.print(f"\n[green]✅ Configuration saved to {config_path}[/green]")
 
         # Automatically run install-hook
         console.print("\n[bold]Next Step: Installing Git Hooks[/bold]")
-        hook_type = "none"
-        if (
-            config_data["commit_message_enabled"]
-            and config_data["doc_generation_enabled"]
-        ):
-            hook_type = "both"
-        elif config_data["commit_message_enabled"]:
-            hook_type = "message"
-        elif config_data["doc_generation_enabled"]:
-            hook_type = "docs"
+        from .hook_commands import _HOOK_TYPE_FOR_TASKS, install_hook
 
+        hook_type = _HOOK_TYPE_FOR_TASKS[
+            (
+                bool(config_data["commit_message_enabled"]),
+                bool(config_data["doc_generation_enabled"]),
+            )
+        ]
         if hook_type != "none":
-            from .commands import install_hook
-
             ctx.invoke(install_hook, hook_type=hook_type, force=force)
 
         # Prompt to set up alias
@@ -193,14 +213,12 @@ def init_command(
             config_data["commit_message_enabled"]
             and answers.get("setup_alias") == "Yes"
         ):
-            from .commands import set_alias
+            from .alias_command import set_alias
 
             ctx.invoke(set_alias)
         else:
             console.print("\nTo generate a commit message, you can run:")
-            console.print(
-                "[bold cyan]git diff --cached | commitlm generate --short-message[/bold cyan]"
-            )
+            console.print("[bold cyan]git diff --cached | commitlm-msg[/bold cyan]")
             console.print(
                 "\nYou can set up an alias for this command later by running:"
             )
@@ -213,11 +231,13 @@ def init_command(
 
 def _prompt_for_task_model(default_provider: str) -> dict:
     """Helper to prompt for task-specific model config."""
+    from InquirerPy import prompt
+
     questions = [
         {
             "type": "list",
             "message": "Provider for this task",
-            "choices": ["huggingface", "gemini", "anthropic", "openai"],
+            "choices": list(PROVIDERS),
             "name": "provider",
             "default": default_provider,
             "qmark": "",
@@ -233,21 +253,78 @@ def _prompt_for_task_model(default_provider: str) -> dict:
     return {"provider": answers.get("provider"), "model": answers.get("model")}
 
 
+def _confirm_overwrite(config_path: Path) -> bool:
+    """Ask whether an existing configuration file may be replaced."""
+    from InquirerPy import prompt
+
+    questions = [
+        {
+            "type": "list",
+            "message": f"Configuration file {config_path} already exists. Overwrite?",
+            "choices": ["Yes", "No"],
+            "name": "overwrite",
+            "default": "No",
+            "qmark": "",
+        }
+    ]
+    answers = prompt(questions)
+    return answers.get("overwrite") != "No"
+
+
+def _write_config(config_path: Path, config_data: dict, overwrite: bool) -> bool:
+    """Write the config file, re-asking if one appeared during the prompts.
+
+    Unless overwriting was already allowed the file is created exclusively, so a
+    config written by something else while init was running is never clobbered
+    without confirmation.
+    """
+    from ..config.settings import dump_config_bytes
+
+    payload = dump_config_bytes(config_data)
+    if not overwrite:
+        try:
+            with open(config_path, "xb") as f:
+                f.write(payload)
+            return True
+        except FileExistsError:
+            if not _confirm_overwrite(config_path):
+                return False
+
+    with open(config_path, "wb") as f:
+        f.write(payload)
+    return True
+
+
+@lru_cache(maxsize=1)
+def _model_table() -> "Table":
+    """Build the table of available local models once per process."""
+    from rich.table import Table
+
+    from ..config.settings import CPU_MODEL_CONFIGS
+    from ..core.llm_client import get_available_models
+
+    model_table = Table(show_header=True, header_style="bold magenta")
+    model_table.add_column("Model", style="cyan", no_wrap=True)
+    model_table.add_column("Description")
+    for model_key in get_available_models():
+        model_table.add_row(model_key, CPU_MODEL_CONFIGS[model_key]["description"])
+    return model_table
+
+
 def _init_huggingface(config_data: dict, model: Optional[str]):
     """Initialize HuggingFace configuration."""
+    from InquirerPy import prompt
+
+    from ..core.llm_client import get_available_models
+
+    console = get_console()
     available_models = get_available_models()
     if not available_models:
         console.print("[red]❌ No HuggingFace models available![/red]")
         sys.exit(1)
 
     console.print("\n[bold]Available Local Models:[/bold]")
-    model_table = Table(show_header=True, header_style="bold magenta")
-    model_table.add_column("Model", style="cyan", no_wrap=True)
-    model_table.add_column("Description")
-    for model_key in available_models:
-        model_info = CPU_MODEL_CONFIGS[model_key]
-        model_table.add_row(model_key, model_info["description"])
-    console.print(model_table)
+    console.print(_model_table())
 
     if not model:
         questions = [
@@ -269,6 +346,8 @@ def _init_huggingface(config_data: dict, model: Optional[str]):
 
 def _init_api_provider(config_data: dict, provider: str, model: Optional[str]):
     """Initialize API provider configuration."""
+    from InquirerPy import prompt
+
     questions = [
         {
             "type": "password",
@@ -281,17 +360,12 @@ def _init_api_provider(config_data: dict, provider: str, model: Optional[str]):
     api_key = answers.get("api_key")
 
     if not model:
-        default_models = {
-            "gemini": "gemini-2.5-flash",
-            "anthropic": "claude-3-5-haiku-latest",
-            "openai": "gpt-5-mini-2025-08-07",
-        }
         questions = [
             {
                 "type": "input",
                 "message": f"Enter {provider.capitalize()} model",
                 "name": "model",
-                "default": default_models.get(provider, ""),
+                "default": _DEFAULT_API_MODELS.get(provider, ""),
                 "qmark": "",
             }
         ]
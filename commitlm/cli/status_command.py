@@ -0,0 +1,72 @@
+"""Status command for CommitLM."""
+
+from pathlib import Path
+
+import click
+
+from ._shared import get_console
+
+
+@click.command()
+@click.pass_context
+def status(ctx: click.Context):
+    """Show current status and configuration."""
+    from rich.table import Table
+
+    console = get_console()
+    settings = ctx.obj["settings"]
+    console.print("[bold blue]📊 CommitLM Status[/bold blue]")
+
+    status_table = Table(show_header=True, header_style="bold magenta")
+    status_table.add_column("Component", style="cyan")
+    status_table.add_column("Status", justify="center")
+    status_table.add_column("Details")
+
+    status_table.add_row("LLM Provider", "✅", settings.provider)
+    status_table.add_row("Default Model", "✅", settings.model)
+
+    # Show task-specific models if configured
+    if settings.commit_message_enabled and settings.commit_message:
+        commit_provider = settings.commit_message.provider or settings.provider
+        commit_model = settings.commit_message.model or settings.model
+        status_table.add_row(
+            "Commit Message Model",
+            "✅",
+            f"{commit_provider}/{commit_model}",
+        )
+
+    if settings.doc_generation_enabled and settings.doc_generation:
+        doc_provider = settings.doc_generation.provider or settings.provider
+        doc_model = settings.doc_generation.model or settings.model
+        status_table.add_row("Documentation Model", "✅", f"{doc_provider}/{doc_model}")
+
+    if settings.provider == "huggingface":
+        from ..core.llm_client import get_available_models
+
+        available_models = get_available_models()
+        if available_models:
+            status_table.add_row(
+                "HuggingFace", "✅ Available", f"{len(available_models)} models ready"
+            )
+        else:
+            status_table.add_row(
+                "HuggingFace", "❌ Not installed", "Run: pip install transformers torch"
+            )
+        hf_config = settings.get_active_llm_config()
+        device_info = hf_config.get_device_info()
+        device_status = (
+            f"{device_info['device'].upper()} ({device_info['acceleration']})"
+        )
+        if device_info.get("gpu_name"):
+            device_status += f" - {device_info['gpu_name']}"
+        status_table.add_row("Hardware", "🚀", device_status)
+
+    config_file = Path(".commitlm-config.json")
+    if config_file.exists():
+        status_table.add_row("Configuration", "✅", str(config_file.resolve()))
+    else:
+        status_table.add_row(
+            "Configuration", "❌", "No config file found (run 'commitlm init')"
+        )
+
+    console.print(status_table)
@@ -0,0 +1,101 @@
+"""Enable-task command for CommitLM."""
+
+import click
+
+from ._shared import get_console
+from .hook_commands import _HOOK_TYPE_FOR_TASKS, install_hook, uninstall_hook
+
+
+@click.command("enable-task")
+@click.pass_context
+def enable_task(ctx: click.Context):
+    """Enable or disable tasks and configure their models."""
+    from InquirerPy import prompt
+
+    from ..config.settings import TaskSettings
+
+    console = get_console()
+    settings = ctx.obj["settings"]
+
+    questions = [
+        {
+            "type": "list",
+            "message": "Which tasks do you want to enable?",
+            "choices": ["commit_message", "doc_generation", "both"],
+            "name": "enabled_tasks",
+            "default": "both",
+            "qmark": "",
+        }
+    ]
+    answers = prompt(questions)
+    enabled_tasks = answers.get("enabled_tasks")
+    settings.commit_message_enabled = enabled_tasks in ["commit_message", "both"]
+    settings.doc_generation_enabled = enabled_tasks in ["doc_generation", "both"]
+
+    questions = [
+        {
+            "type": "list",
+            "message": "\nDo you want to use different models for the enabled tasks?",
+            "choices": ["Yes", "No"],
+            "name": "use_specific_models",
+            "default": "No",
+            "qmark": "",
+        }
+    ]
+    answers = prompt(questions)
+
+    if answers.get("use_specific_models") == "Yes":
+        if settings.commit_message_enabled:
+            questions = [
+                {
+                    "type": "list",
+                    "message": "Configure a specific model for commit message generation?",
+                    "choices": ["Yes", "No"],
+                    "name": "config_commit_msg_model",
+                    "default": "Yes",
+                    "qmark": "",
+                }
+            ]
+            answers = prompt(questions)
+            if answers.get("config_commit_msg_model") == "Yes":
+                from .init_command import _prompt_for_task_model
+
+                task_config = _prompt_for_task_model(settings.provider)
+                settings.commit_message = TaskSettings(**task_config)
+
+        if settings.doc_generation_enabled:
+            questions = [
+                {
+                    "type": "list",
+                    "message": "Configure a specific model for documentation generation?",
+                    "choices": ["Yes", "No"],
+                    "name": "config_doc_gen_model",
+                    "default": "Yes",
+                    "qmark": "",
+                }
+            ]
+            answers = prompt(questions)
+            if answers.get("config_doc_gen_model") == "Yes":
+                from .init_command import _prompt_for_task_model
+
+                task_config = _prompt_for_task_model(settings.provider)
+                settings.doc_generation = TaskSettings(**task_config)
+    else:
+        # Reset task-specific models if user chooses not to use them
+        settings.commit_message = None
+        settings.doc_generation = None
+
+    settings.save_to_file(ctx.obj["config_path"])
+    console.print("[green]✅ Tasks enabled and configured successfully.[/green]")
+
+    # Also need to reinstall hooks
+    console.print("\n[bold]Re-installing Git Hooks based on new settings...[/bold]")
+    hook_type = _HOOK_TYPE_FOR_TASKS[
+        (bool(settings.commit_message_enabled), bool(settings.doc_generation_enabled))
+    ]
+
+    if hook_type != "none":
+        ctx.invoke(install_hook, hook_type=hook_type, force=True)
+    else:
+        # if no tasks are enabled, we should probably uninstall all hooks
+        ctx.invoke(uninstall_hook)
@@ -1,11 +1,20 @@
 """Configuration settings for AI docs generator using Pydantic v2."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Literal, Any, Dict, Union
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 load_dotenv()
 
 HuggingFaceModel = Literal["phi-3-mini-128k", "tinyllama", "qwen2.5-coder-1.5b"]
@@ -82,6 +91,58 @@ CPU_MODEL_CONFIGS = {
 }
 
 
+@lru_cache(maxsize=1)
+def _detect_best_device() -> str:
+    """Detect the best available device, probing torch once per process."""
+    try:
+        import torch
+
+        if torch.cuda.is_available():
+            return "cuda"
+
+        if hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
+            return "mps"
+
+        return "cpu"
+
+    except ImportError:
+        return "cpu"
+
+
+@lru_cache(maxsize=None)
+def _probe_device_info(device: str) -> Dict[str, Any]:
+    """Get information about a device, probing torch once per device."""
+    info: Dict[str, Any] = {"device": device, "acceleration": "None"}
+
+    try:
+        import torch
+
+        if device == "cuda" and torch.cuda.is_available():
+            gpu_count = torch.cuda.device_count()
+            gpu_name = torch.cuda.get_device_name(0) if gpu_count > 0 else "Unknown"
+            memory_gb = (
+                torch.cuda.get_device_properties(0).total_memory // (1024**3)
+                if gpu_count > 0
+                else 0
+            )
+            info["gpu_count"] = gpu_count
+            info["gpu_name"] = gpu_name
+            info["gpu_memory_gb"] = memory_gb
+            info["acceleration"] = "CUDA"
+        elif device == "mps":
+            info["acceleration"] = "Apple Metal Performance Shaders"
+        else:
+            import multiprocessing
+
+            info["cpu_cores"] = multiprocessing.cpu_count()
+            info["acceleration"] = "CPU-only"
+
+    except ImportError:
+        pass
+
+    return info
+
+
 class HuggingFaceConfig(BaseModel):
     """HuggingFace local model configuration."""
 
@@ -156,52 +217,12 @@ class HuggingFaceConfig(BaseModel):
 
     def _detect_best_device(self) -> str:
         """Detect the best available device for model inference."""
-        try:
-            import torch
-
-            if torch.cuda.is_available():
-                return "cuda"
-
-            if hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-                return "mps"
-
-            return "cpu"
-
-        except ImportError:
-            return "cpu"
+        return _detect_best_device()
 
     def get_device_info(self) -> Dict[str, Any]:
         """Get information about the selected device."""
-        device = self.get_optimal_device()
-        info: Dict[str, Any] = {"device": device, "acceleration": "None"}
-
-        try:
-            import torch
-
-            if device == "cuda" and torch.cuda.is_available():
-                gpu_count = torch.cuda.device_count()
-                gpu_name = torch.cuda.get_device_name(0) if gpu_count > 0 else "Unknown"
-                memory_gb = (
-                    torch.cuda.get_device_properties(0).total_memory // (1024**3)
-                    if gpu_count > 0
-                    else 0
-                )
-                info["gpu_count"] = gpu_count
-                info["gpu_name"] = gpu_name
-                info["gpu_memory_gb"] = memory_gb
-                info["acceleration"] = "CUDA"
-            elif device == "mps":
-                info["acceleration"] = "Apple Metal Performance Shaders"
-            else:
-                import multiprocessing
-
-                info["cpu_cores"] = multiprocessing.cpu_count()
-                info["acceleration"] = "CPU-only"
-
-        except ImportError:
-            pass
-
-        return info
+        # Copy so callers can't modify the cached probe result
+        return dict(_probe_device_info(self.get_optimal_device()))
 
     def supports_yarn(self) -> bool:
         """Check if the current model supports YaRN."""
@@ -374,15 +395,27 @@ class Settings(BaseModel):
 
         config = getattr(self, provider, None)
         if config:
-            config_copy = config.copy(deep=True)
-            config_copy.model = model
-            return config_copy
+            # Provider configs only hold scalars, so a shallow copy is enough
+            return config.model_copy(update={"model": model})
         return None
 
     def save_to_file(self, path: Union[str, Path]):
         """Save the current settings to a file."""
-        with open(path, "w") as f:
-            json.dump(self.model_dump(), f, indent=2)
+        Path(path).write_bytes(dump_config_bytes(self.model_dump()))
+
+
+def load_config_bytes(raw: bytes) -> Dict[str, Any]:
+    """Parse config file contents, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dump_config_bytes(config_data: Dict[str, Any]) -> bytes:
+    """Serialize config data as indented JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(config_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(config_data, indent=2).encode("utf-8")
 
 
 _settings: Optional[Settings] = None
@@ -394,10 +427,16 @@ def init_settings(config_path: Optional[Union[str, Path]] = None) -> Settings:
     if _settings is not None:
         return _settings
 
-    if config_path and Path(config_path).exists():
-        with open(config_path, "r") as f:
-            config_data = json.load(f)
-        _settings = Settings(**config_data)
+    raw_config: Optional[bytes] = None
+    if config_path:
+        try:
+            raw_config = Path(config_path).read_bytes()
+        except FileNotFoundError:
+            pass
+
+    if raw_config is not None:
+        # Parse and validate in one pass inside pydantic-core
+        _settings = Settings.model_validate_json(raw_config)
     else:
         # This case should ideally be handled by the CLI, prompting for init
         # For now, we create a default placeholder
@@ -406,6 +445,15 @@ def init_settings(config_path: Optional[Union[str, Path]] = None) -> Settings:
     return _settings
 
 
+def apply_overrides(settings: Settings, overrides: Dict[str, Any]) -> Settings:
+    """Return a copy of settings with top-level fields overridden and validated."""
+    updated = settings.model_copy()
+    for name, value in overrides.items():
+        # Validates just this field instead of rebuilding the whole model
+        Settings.__pydantic_validator__.validate_assignment(updated, name, value)
+    return updated
+
+
 def get_settings() -> Settings:
     """Get the global settings instance."""
     if _settings is None:
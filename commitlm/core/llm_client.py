@@ -1,6 +1,7 @@
 """HuggingFace local model client for CPU-optimized documentation generation."""
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import List, Optional, Union
 import logging
 import os
@@ -86,10 +87,32 @@ class LLMClient(ABC):
         """Return the provider name."""
         pass
 
+    @abstractmethod
+    def _generate_fallback(self) -> str:
+        """Return the placeholder text used when generation fails."""
+        pass
+
     def _generate_short_message_fallback(self) -> str:
         """Simple fallback for a short commit message."""
         return SHORT_MESSAGE_FALLBACK
 
+    def check_connection(self) -> str:
+        """Send a one-token request and return the reply.
+
+        generate_text() turns API and model failures into fallback text rather
+        than raising, so this raises LLMClientError for an empty or fallback reply.
+        """
+        response = self.generate_text("Hi", max_tokens=1)
+        if not response or not response.strip():
+            raise LLMClientError("No response received")
+        if self.is_fallback_response(response):
+            raise LLMClientError("Request failed (check the logs for details)")
+        return response
+
+    def is_fallback_response(self, response: str) -> bool:
+        """Check whether a reply is the placeholder returned after a failure."""
+        return response == self._generate_fallback()
+
 
 class HuggingFaceClient(LLMClient):
     """CPU-optimized Hugging Face client for local models."""
@@ -260,6 +283,25 @@ class HuggingFaceClient(LLMClient):
             logger.error(f"Generation failed: {e}")
             return self._generate_fallback()
 
+    def check_connection(self) -> str:
+        """Run a single decoding step on the loaded local model.
+
+        A one-token reply may be just EOS or whitespace, which generate_text()
+        would replace with fallback text, so the pipeline is called directly and
+        only an exception counts as a failure.
+        """
+        try:
+            self.pipeline(
+                self._format_prompt("Hi"),
+                max_new_tokens=1,
+                pad_token_id=self.tokenizer.eos_token_id,
+                eos_token_id=self.tokenizer.eos_token_id,
+                num_return_sequences=1,
+            )
+        except Exception as e:
+            raise LLMClientError(f"Local model failed to generate: {e}")
+        return "Reachable"
+
     def _generate_standard(self, prompt: str, **kwargs) -> str:
         """Standard generation for larger models."""
         try:
@@ -786,6 +828,7 @@ def create_llm_client(settings: Settings, task: Optional[str] = None) -> LLMClie
     return LLMClientFactory.create_client(settings, task)
 
 
+@lru_cache(maxsize=1)
 def get_available_models() -> List[str]:
-    """Convenience function to get available models."""
+    """Convenience function to get available models (cached per process)."""
     return LLMClientFactory.get_available_models()
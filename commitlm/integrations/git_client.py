@@ -249,27 +249,17 @@ class GitClient:
         """Get the repository name."""
         return self.repo_path.name
 
-    def install_post_commit_hook(self, hook_script_path: Path) -> bool:
-        """Install a post-commit hook script.
+    def install_post_commit_hook_from_text(self, hook_content: str) -> bool:
+        """Install a post-commit hook from the script content.
 
         Args:
-            hook_script_path: Path to the hook script to install
+            hook_content: Content of the hook script
 
         Returns:
             True if installation successful, False otherwise
         """
         try:
-            hooks_dir = self.repo_path / ".git" / "hooks"
-            hook_file = hooks_dir / "post-commit"
-
-            hooks_dir.mkdir(exist_ok=True)
-
-            import shutil
-
-            shutil.copy2(hook_script_path, hook_file)
-
-            hook_file.chmod(0o755)
-
+            hook_file = self._write_hook("post-commit", hook_content)
             logger.info(f"Post-commit hook installed at {hook_file}")
             return True
 
@@ -277,20 +267,10 @@ class GitClient:
             logger.error(f"Failed to install post-commit hook: {e}")
             return False
 
-    def install_prepare_commit_msg_hook(self, hook_script_path: Path) -> bool:
-        """Install a prepare-commit-msg hook script."""
+    def install_prepare_commit_msg_hook_from_text(self, hook_content: str) -> bool:
+        """Install a prepare-commit-msg hook from the script content."""
         try:
-            hooks_dir = self.repo_path / ".git" / "hooks"
-            hook_file = hooks_dir / "prepare-commit-msg"
-
-            hooks_dir.mkdir(exist_ok=True)
-
-            import shutil
-
-            shutil.copy2(hook_script_path, hook_file)
-
-            hook_file.chmod(0o755)
-
+            hook_file = self._write_hook("prepare-commit-msg", hook_content)
             logger.info(f"Prepare-commit-msg hook installed at {hook_file}")
             return True
 
@@ -298,17 +278,28 @@ class GitClient:
             logger.error(f"Failed to install prepare-commit-msg hook: {e}")
             return False
 
-    def create_post_commit_hook_script(self, output_path: Path) -> bool:
-        """Create a post-commit hook script that calls CommitLM.
+    def _write_hook(self, hook_name: str, hook_content: str) -> Path:
+        """Write an executable hook script into .git/hooks."""
+        hooks_dir = self.repo_path / ".git" / "hooks"
+        hook_file = hooks_dir / hook_name
 
-        Args:
-            output_path: Where to save the hook script
+        hooks_dir.mkdir(exist_ok=True)
+
+        fd = os.open(hook_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+        with os.fdopen(fd, "w") as f:
+            f.write(hook_content)
+
+        # The mode passed to os.open only applies when the file is created
+        hook_file.chmod(0o755)
+        return hook_file
+
+    def create_post_commit_hook_script(self) -> str:
+        """Create a post-commit hook script that calls CommitLM.
 
         Returns:
-            True if script created successfully
+            Content of the hook script
         """
-        try:
-            hook_content = """#!/bin/bash
+        return """#!/bin/bash
 # CommitLM Post-Commit Hook
 # This script automatically generates documentation after each commit
 
@@ -397,24 +388,9 @@ mv "$TEMP_FILE" "$DOC_FILENAME"
 echo "CommitLM: Documentation generated at $DOC_FILENAME"
 """
 
-            # Write the hook script
-            with open(output_path, "w") as f:
-                f.write(hook_content)
-
-            # Make it executable
-            output_path.chmod(0o755)
-
-            logger.info(f"Post-commit hook script created at {output_path}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to create post-commit hook script: {e}")
-            return False
-
-    def create_prepare_commit_msg_hook_script(self, output_path: Path) -> bool:
+    def create_prepare_commit_msg_hook_script(self) -> str:
         """Create a prepare-commit-msg hook script that calls CommitLM."""
-        try:
-            hook_content = """#!/bin/bash
+        return """#!/bin/bash
 # CommitLM Generator Prepare-Commit-Msg Hook
 
 COMMIT_MSG_FILE=$1
@@ -430,7 +406,7 @@ if [ "$COMMIT_SOURCE" != "message" ]; then
 
         if [ -n "$DIFF_OUTPUT" ]; then
             # Call commitlm to generate message
-            GENERATED_MSG=$(echo "$DIFF_OUTPUT" | commitlm generate --short-message)
+            GENERATED_MSG=$(echo "$DIFF_OUTPUT" | commitlm-msg)
 
             # Write message to commit message file
             echo "$GENERATED_MSG" > "$COMMIT_MSG_FILE"
@@ -438,15 +414,6 @@ if [ "$COMMIT_SOURCE" != "message" ]; then
     fi
 fi
 """
-            with open(output_path, "w") as f:
-                f.write(hook_content)
-
-            output_path.chmod(0o755)
-            logger.info(f"Prepare-commit-msg hook script created at {output_path}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to create prepare-commit-msg hook script: {e}")
-            return False
 
 
 def get_git_client(repo_path: Optional[Path] = None) -> GitClient:
@@ -3,6 +3,7 @@
 import re
 import hashlib
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -68,8 +69,12 @@ def get_git_root(path: Path | None = None) -> Optional[Path]:
     if path is None:
         path = Path.cwd()
 
-    path = Path(path).resolve()
+    return _find_git_root(Path(path).resolve())
 
+
+@lru_cache(maxsize=None)
+def _find_git_root(path: Path) -> Optional[Path]:
+    """Walk up from a resolved path looking for .git, memoized per process."""
     while path != path.parent:
         if (path / ".git").exists():
             return path